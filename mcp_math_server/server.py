@@ -7,21 +7,50 @@ operations as tools with automatic schema generation and validation.
 Organized into categories: basic arithmetic, advanced operations, and number theory.
 """
 
+import asyncio
 import math
-from typing import Annotated
+import sys
+from collections import Counter
+from functools import lru_cache, partial
+from typing import Annotated, Any, Callable
 from datetime import datetime
 
+import anyio
 import click
 from fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
-# Initialize FastMCP server
-mcp = FastMCP("mcp-math-server")
+try:
+    from numba import cuda, njit  # type: ignore[import-not-found]
+except ImportError:  # Numba is optional; trial division falls back to pure Python
+    cuda = njit = None
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch_eval falls back to evaluating ops one by one
+    np = None  # type: ignore[assignment]
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows; use the asyncio loop
+    uvloop = None  # type: ignore[assignment]
+
+# Initialize FastMCP server. Tools that can run long on large inputs are async and
+# compute in a worker thread so they do not block other requests on the event loop.
+# Tools are registered with output_schema=None and without FastMCP's metadata so that
+# the tool listing every client fetches on connect only carries what clients need.
+mcp = FastMCP("mcp-math-server", include_fastmcp_meta=False)
 
 # Server start time for health check
 _server_start_time = datetime.now()
 
+# Pre-serialized health check response; only the uptime and timestamp vary per request
+_HEALTH_TEMPLATE = (
+    b'{"status":"healthy","server":"mcp-math-server",'
+    b'"uptime":"%s","uptime_seconds":%d,"timestamp":"%s"}'
+)
+
 
 # =============================================================================
 # HEALTH CHECK ENDPOINT
@@ -29,30 +58,31 @@ _server_start_time = datetime.now()
 
 
 @mcp.custom_route("/health", methods=["GET"])
-async def health_check(request: Request) -> JSONResponse:
+async def health_check(request: Request) -> Response:
     """Health check endpoint.
     
     Returns server status, uptime, and version information.
     """
-    uptime = datetime.now() - _server_start_time
-    uptime_seconds = int(uptime.total_seconds())
-    uptime_str = str(uptime).split('.')[0]  # Remove microseconds
+    now = datetime.now()
+    uptime = now - _server_start_time
     
-    return JSONResponse({
-        "status": "healthy",
-        "server": "mcp-math-server",
-        "uptime": uptime_str,
-        "uptime_seconds": uptime_seconds,
-        "timestamp": datetime.now().isoformat()
-    })
+    content = _HEALTH_TEMPLATE % (
+        str(uptime).split('.', 1)[0].encode(),  # Remove microseconds
+        int(uptime.total_seconds()),
+        now.isoformat().encode(),
+    )
+    return Response(content=content, media_type="application/json")
 
 
 # =============================================================================
 # BASIC ARITHMETIC OPERATIONS
 # =============================================================================
 
+# These tools are cheap enough that building the response string is a noticeable share
+# of each call, so they concatenate onto a constant prefix instead of using f-strings.
+
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 def add(
     a: Annotated[float, "First number"],
     b: Annotated[float, "Second number"],
@@ -62,10 +92,10 @@ def add(
     Returns the sum of a and b.
     """
     result = a + b
-    return f"Result: {result}"
+    return "Result: " + str(result)
 
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 def subtract(
     a: Annotated[float, "First number"],
     b: Annotated[float, "Second number"],
@@ -75,10 +105,10 @@ def subtract(
     Returns the difference (a - b).
     """
     result = a - b
-    return f"Result: {result}"
+    return "Result: " + str(result)
 
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 def multiply(
     a: Annotated[float, "First number"],
     b: Annotated[float, "Second number"],
@@ -88,10 +118,17 @@ def multiply(
     Returns the product of a and b.
     """
     result = a * b
-    return f"Result: {result}"
+    return "Result: " + str(result)
+
+
+def _divide_result(a: float, b: float) -> str:
+    """Response for divide, shared with batch_eval."""
+    if b == 0:
+        return "Error: Division by zero is not allowed"
+    return "Result: " + str(a / b)
 
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 def divide(
     a: Annotated[float, "Numerator"],
     b: Annotated[float, "Denominator"],
@@ -100,10 +137,7 @@ def divide(
     
     Returns the quotient (a / b). Raises an error for division by zero.
     """
-    if b == 0:
-        return "Error: Division by zero is not allowed"
-    result = a / b
-    return f"Result: {result}"
+    return _divide_result(a, b)
 
 
 # =============================================================================
@@ -111,8 +145,39 @@ def divide(
 # =============================================================================
 
 
-@mcp.tool()
-def power(
+# Integer powers are computed exactly only while the result stays below this many bits
+_MAX_EXACT_POWER_BITS = 8192
+
+# Whole-number floats above 2^53 are usually rounded values, so they are not exact bases
+_MAX_EXACT_POWER_BASE = 2 ** 53
+
+
+def _power_impl(base: float, exponent: float) -> float | int:
+    """base ** exponent, using exact integer or binary exponentiation for whole exponents."""
+    result: float | int
+    if float(exponent).is_integer() and -2 ** 31 < exponent < 2 ** 31:
+        e = int(exponent)
+        if (
+            e >= 0
+            and float(base).is_integer()
+            and abs(base) <= _MAX_EXACT_POWER_BASE
+            and int(base).bit_length() * e <= _MAX_EXACT_POWER_BITS
+        ):
+            result = int(base) ** e
+        else:
+            result = base ** e
+    else:
+        result = base ** exponent
+    return result
+
+
+def _power_result(base: float, exponent: float) -> str:
+    """Response for power, shared with batch_eval."""
+    return f"Result: {_power_impl(base, exponent)}"
+
+
+@mcp.tool(output_schema=None)
+async def power(
     base: Annotated[float, "Base number"],
     exponent: Annotated[float, "Exponent"],
 ) -> str:
@@ -120,11 +185,17 @@ def power(
     
     Returns base raised to the power of exponent (base^exponent).
     """
-    result = base ** exponent
-    return f"Result: {result}"
+    return await asyncio.to_thread(_power_result, base, exponent)
 
 
-@mcp.tool()
+def _sqrt_result(x: float) -> str:
+    """Response for sqrt, shared with batch_eval."""
+    if x < 0:
+        return "Error: Cannot calculate square root of negative number"
+    return f"Result: {math.sqrt(x)}"
+
+
+@mcp.tool(output_schema=None)
 def sqrt(
     x: Annotated[float, "Number to find square root of (must be non-negative)"],
 ) -> str:
@@ -132,13 +203,19 @@ def sqrt(
     
     Returns the square root of x. The input must be non-negative.
     """
-    if x < 0:
-        return "Error: Cannot calculate square root of negative number"
-    result = math.sqrt(x)
-    return f"Result: {result}"
+    return _sqrt_result(x)
 
 
-@mcp.tool()
+def _logarithm_result(x: float, base: float = math.e) -> str:
+    """Response for logarithm, shared with batch_eval."""
+    if x <= 0:
+        return "Error: Logarithm requires a positive number"
+    if base <= 0 or base == 1:
+        return "Error: Logarithm base must be positive and not equal to 1"
+    return f"Result: {math.log(x, base)}"
+
+
+@mcp.tool(output_schema=None)
 def logarithm(
     x: Annotated[float, "Number to find logarithm of (must be positive)"],
     base: Annotated[float, "Base of the logarithm (default: e for natural log)"] = math.e,
@@ -147,15 +224,10 @@ def logarithm(
     
     Returns log_base(x). Defaults to natural logarithm if base not specified.
     """
-    if x <= 0:
-        return "Error: Logarithm requires a positive number"
-    if base <= 0 or base == 1:
-        return "Error: Logarithm base must be positive and not equal to 1"
-    result = math.log(x, base)
-    return f"Result: {result}"
+    return _logarithm_result(x, base)
 
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 def absolute(
     x: Annotated[float, "Number to find absolute value of"],
 ) -> str:
@@ -167,7 +239,14 @@ def absolute(
     return f"Result: {result}"
 
 
-@mcp.tool()
+def _modulo_result(a: float, b: float) -> str:
+    """Response for modulo, shared with batch_eval."""
+    if b == 0:
+        return "Error: Modulo by zero is not allowed"
+    return f"Result: {a % b}"
+
+
+@mcp.tool(output_schema=None)
 def modulo(
     a: Annotated[float, "Dividend"],
     b: Annotated[float, "Divisor"],
@@ -176,10 +255,7 @@ def modulo(
     
     Returns the remainder when a is divided by b (a mod b).
     """
-    if b == 0:
-        return "Error: Modulo by zero is not allowed"
-    result = a % b
-    return f"Result: {result}"
+    return _modulo_result(a, b)
 
 
 # =============================================================================
@@ -187,21 +263,394 @@ def modulo(
 # =============================================================================
 
 
-@mcp.tool()
-def factorial(
+# Primes used for trial division before Miller-Rabin
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
+# Product of the odd primes in _SMALL_PRIMES, small enough to fit in 64 bits
+_ODD_PRIMORIAL = math.prod(_SMALL_PRIMES[1:])
+
+# Any n below 59^2 with no factor in _SMALL_PRIMES is prime
+_SMALL_PRIMES_LIMIT = 59 * 59
+
+# Witness set that makes Miller-Rabin deterministic for n < 3.18e23 (covers all 64-bit n)
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# From 2^64 on, n is tested with Baillie-PSW, which has no known counterexamples
+_BPSW_LIMIT = 2 ** 64
+
+# Below 2^32 a base-2 test plus one hashed witness is deterministic. Every composite
+# n < 2^32 with no factor in _SMALL_PRIMES that passes base 2 fails the base stored at
+# _mr_hash(n), which was checked against all of them exhaustively.
+_MR_HASH_LIMIT = 2 ** 32
+_MR_HASH_BASES = bytes((
+    3, 3, 3, 3, 3, 3, 5, 3, 5, 3, 3, 3, 3, 5, 7, 3,
+    5, 7, 5, 3, 3, 3, 3, 3, 3, 3, 7, 3, 3, 5, 3, 3,
+    3, 3, 5, 3, 5, 3, 3, 3, 3, 7, 3, 7, 7, 5, 3, 3,
+    3, 3, 3, 3, 3, 3, 7, 3, 7, 10, 3, 5, 3, 5, 3, 3,
+    3, 3, 3, 3, 3, 7, 5, 3, 3, 3, 3, 3, 5, 3, 3, 5,
+    3, 5, 3, 3, 5, 3, 3, 7, 3, 3, 5, 5, 3, 3, 3, 3,
+    3, 3, 3, 3, 5, 5, 3, 14, 3, 3, 5, 3, 5, 3, 3, 3,
+    5, 5, 3, 3, 7, 3, 3, 5, 3, 3, 5, 3, 3, 3, 3, 3,
+    3, 3, 5, 3, 5, 3, 5, 11, 3, 7, 3, 3, 3, 5, 5, 3,
+    13, 13, 3, 3, 3, 3, 3, 3, 3, 5, 5, 3, 5, 3, 7, 5,
+    3, 3, 3, 3, 3, 3, 3, 3, 7, 3, 3, 3, 5, 5, 3, 3,
+    5, 3, 3, 3, 3, 3, 3, 7, 7, 7, 3, 3, 5, 3, 3, 5,
+    5, 3, 5, 3, 3, 5, 5, 3, 5, 3, 3, 3, 3, 11, 3, 3,
+    3, 3, 3, 3, 5, 5, 3, 3, 5, 3, 3, 3, 3, 7, 7, 7,
+    7, 3, 5, 7, 3, 3, 3, 3, 5, 3, 3, 3, 5, 3, 3, 7,
+    5, 3, 3, 5, 3, 7, 3, 3, 5, 3, 5, 5, 7, 3, 3, 5,
+))
+
+
+# Size of the per-tool result caches for the deterministic number theory tools
+_CACHE_SIZE = 4096
+
+# Factorials from this n on are summarised unless the full value is requested
+_FACTORIAL_SUMMARY_THRESHOLD = 1000
+
+# Factorials above this n are not cached, as each entry would hold a huge integer
+_FACTORIAL_CACHE_LIMIT = 10000
+
+# Trial division to find a factor is limited to n that fit in a signed 64-bit integer
+_TRIAL_DIVISION_LIMIT = 2 ** 63
+
+# Values per gcd in Pollard's rho; batching amortizes the gcd over many multiplications
+_RHO_BATCH = 128
+
+# Factorization gives up after about this many Pollard's rho steps in total (a second or
+# two of work), which is enough to find prime factors of up to about 12 digits
+_RHO_MAX_STEPS = 1 << 22
+
+# Trial division on the GPU, used by factor when Numba can reach a CUDA device
+_CUDA_AVAILABLE = cuda is not None and cuda.is_available()
+_CUDA_THREADS_PER_BLOCK = 256
+_CUDA_CHUNK = 1 << 24
+
+# Gaps between consecutive integers coprime to 30, starting from 7
+_WHEEL_30_OFFSETS = (4, 2, 4, 2, 4, 6, 2, 6)
+
+
+def _mr_hash(n: int) -> int:
+    """Index into _MR_HASH_BASES for n < 2^32."""
+    h = (((n >> 16) ^ n) * 0x45D9F3B) & 0xFFFFFFFF
+    return ((h >> 16) ^ h) & 0xFF
+
+
+def _miller_rabin(n: int, witnesses: tuple[int, ...]) -> bool:
+    """Strong probable-prime test of odd n > max(witnesses) against each witness."""
+    n_minus_1 = n - 1
+    s = (n_minus_1 & -n_minus_1).bit_length() - 1
+    d = n_minus_1 >> s
+    for a in witnesses:
+        x = pow(a, d, n)
+        if x == 1 or x == n_minus_1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n_minus_1:
+                break
+        else:
+            return False
+    return True
+
+
+def _trial_division_py(n: int, lim: int) -> int:
+    """Smallest odd factor below lim of odd n found by trial division, or 0 if there is none."""
+    for p in (3, 5):
+        if p < lim and n % p == 0:
+            return p
+    # Only test candidates coprime to 30, stepping through the mod-30 wheel from 7
+    i = 7
+    k = 0
+    while i < lim:
+        if n % i == 0:
+            return i
+        i += _WHEEL_30_OFFSETS[k]
+        k = (k + 1) & 7
+    return 0
+
+
+if njit is not None:
+    _trial_division = njit(cache=True)(_trial_division_py)
+    _trial_division(7, 3)  # Compile at import rather than on the first request
+else:
+    _trial_division = _trial_division_py
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Jacobi symbol (a/n) for odd positive n."""
+    a %= n
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas(n: int) -> bool:
+    """Strong Lucas probable-prime test of odd n with Selfridge's parameters."""
+    if math.isqrt(n) ** 2 == n:
+        return False
+    # Selfridge: first D in 5, -7, 9, -11, ... with (D/n) = -1
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P = 1
+    Q = (1 - D) // 4
+    
+    # n + 1 = d * 2^s with d odd
+    s = ((n + 1) & -(n + 1)).bit_length() - 1
+    d = (n + 1) >> s
+    
+    # Compute U_d, V_d and Q^d mod n by walking the bits of d from the top
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = (P * U + V) % n, (D * U + P * V) % n
+            # Halve modulo n: make each value even by adding n if needed
+            if U & 1:
+                U += n
+            if V & 1:
+                V += n
+            U >>= 1
+            V >>= 1
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    return False
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _smallest_factor(n: int) -> int:
+    """Cached smallest factor of odd composite n < _TRIAL_DIVISION_LIMIT, or 0 if not found.
+    
+    Without Numba, trial division up to sqrt(n) can take minutes, so n is factorized with
+    the bounded Pollard's rho instead, which gives up on factors that are too large.
+    """
+    if njit is None:
+        factors = _factorize_impl(n)
+        return factors[0][0] if factors is not None else 0
+    # Exact integer square root; Numba has no isqrt, so the bound is computed here
+    return int(_trial_division(n, math.isqrt(n) + 1))
+
+
+def _log10_factorial(n: int) -> float:
+    """log10(n!) from the log-gamma function, in constant time."""
+    return math.lgamma(n + 1) / math.log(10)
+
+
+def _factorial_fits_str(n: int) -> bool:
+    """Whether n! has few enough digits for str() under the interpreter's conversion limit."""
+    # Python 3.11+ refuses to convert integers with more than this many digits (0: no limit)
+    limit = sys.get_int_max_str_digits() if hasattr(sys, "get_int_max_str_digits") else 0
+    return limit == 0 or _log10_factorial(n) < limit
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _factorial_impl(n: int) -> int:
+    """Cached n! for n <= _FACTORIAL_CACHE_LIMIT."""
+    return math.factorial(n)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _gcd_impl(a: int, b: int) -> int:
+    """Cached greatest common divisor."""
+    return math.gcd(a, b)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _lcm_impl(a: int, b: int) -> int:
+    """Cached least common multiple."""
+    return math.lcm(a, b)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _is_prime_impl(n: int) -> tuple[bool, int | None]:
+    """Primality of n >= 2 as (is_prime, smallest small-prime divisor if one was found)."""
+    if n == 2:
+        return True, None
+    if not n & 1:
+        return False, 2
+    
+    # A single gcd against the odd primorial replaces trial division by each small prime
+    g = math.gcd(n, _ODD_PRIMORIAL)
+    if g != 1:
+        if n in _SMALL_PRIMES:
+            return True, None
+        return False, next(p for p in _SMALL_PRIMES if g % p == 0)
+    if n < _SMALL_PRIMES_LIMIT:
+        return True, None
+    
+    if n < _MR_HASH_LIMIT:
+        return _miller_rabin(n, (2, _MR_HASH_BASES[_mr_hash(n)])), None
+    if n < _BPSW_LIMIT:
+        return _miller_rabin(n, _MR_WITNESSES), None
+    return _miller_rabin(n, (2,)) and _strong_lucas(n), None
+
+
+def _pollard_rho(n: int, max_steps: int) -> tuple[int, int]:
+    """Non-trivial factor of odd composite n using Brent's variant of Pollard's rho.
+    
+    Returns the factor and the number of steps taken, with 0 as the factor if none is found
+    within max_steps steps.
+    """
+    steps = 0
+    c = 0
+    while True:
+        c += 1
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        while g == 1:
+            steps += 2 * r
+            if steps > max_steps:
+                return 0, steps
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(_RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += _RHO_BATCH
+            r *= 2
+        if g == n:
+            # The batched gcd overshot; step through the last batch one value at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g, steps
+
+
+if _CUDA_AVAILABLE:
+    @cuda.jit
+    def _trial_division_kernel(n, start, count, result):  # type: ignore[no-untyped-def]
+        # Each thread tests one odd candidate and keeps the smallest divisor found
+        i = cuda.grid(1)
+        if i < count:
+            d = start + 2 * i
+            if n % d == 0:
+                cuda.atomic.min(result, 0, d)
+
+
+def _cuda_smallest_factor(n: int) -> int:
+    """Smallest odd factor of odd n < _TRIAL_DIVISION_LIMIT found on the GPU, or 0."""
+    lim = math.isqrt(n) + 1
+    result = cuda.to_device(np.array([n], dtype=np.int64))
+    start = 3
+    while start < lim:
+        count = min(_CUDA_CHUNK, (lim - start + 1) // 2)
+        blocks = (count + _CUDA_THREADS_PER_BLOCK - 1) // _CUDA_THREADS_PER_BLOCK
+        _trial_division_kernel[blocks, _CUDA_THREADS_PER_BLOCK](n, start, count, result)
+        found = int(result.copy_to_host()[0])
+        if found != n:
+            return found
+        start += 2 * count
+    return 0
+
+
+def _find_factor(n: int, max_steps: int) -> tuple[int, int]:
+    """Non-trivial factor of odd composite n with no factor in _SMALL_PRIMES, or 0.
+    
+    Returns the factor and the number of Pollard's rho steps spent on it.
+    """
+    if _CUDA_AVAILABLE and n < _TRIAL_DIVISION_LIMIT:
+        return _cuda_smallest_factor(n), 0
+    return _pollard_rho(n, max_steps)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _factorize_impl(n: int) -> tuple[tuple[int, int], ...] | None:
+    """Prime factorization of n >= 2 as sorted (prime, exponent) pairs, or None if too hard."""
+    factors: Counter[int] = Counter()
+    for p in _SMALL_PRIMES:
+        while n % p == 0:
+            factors[p] += 1
+            n //= p
+    pending = [n] if n > 1 else []
+    steps_left = _RHO_MAX_STEPS
+    while pending:
+        m = pending.pop()
+        if _is_prime_impl(m)[0]:
+            factors[m] += 1
+            continue
+        d, steps = _find_factor(m, steps_left)
+        if not d:
+            return None
+        steps_left -= steps
+        pending += [d, m // d]
+    return tuple(sorted(factors.items()))
+
+
+@mcp.tool(output_schema=None)
+async def factorial(
     n: Annotated[int, "Non-negative integer to calculate factorial of"],
+    full: Annotated[bool, "Return every digit even for large n (default: false)"] = False,
 ) -> str:
     """Calculate the factorial of a non-negative integer.
     
-    Returns n! = n × (n-1) × (n-2) × ... × 2 × 1.
+    Returns n! = n × (n-1) × (n-2) × ... × 2 × 1. For n >= 1000 only the size of the
+    result is returned unless full is set.
     """
     if n < 0:
         return "Error: Factorial is only defined for non-negative integers"
-    result = math.factorial(n)
-    return f"Result: {result}"
+    if full and not _factorial_fits_str(n):
+        return "Error: Result has too many digits to be converted to a string"
+    compute = math.factorial if n > _FACTORIAL_CACHE_LIMIT else _factorial_impl
+    result = await asyncio.to_thread(compute, n)
+    
+    # Converting a huge integer to decimal dominates the cost of the call, so skip it
+    if n >= _FACTORIAL_SUMMARY_THRESHOLD and not full:
+        hint = " (pass full=true for all digits)" if _factorial_fits_str(n) else ""
+        return f"Result: {result.bit_length()} bits, ≈10^{_log10_factorial(n):.3f}{hint}"
+    try:
+        return f"Result: {result}"
+    except ValueError:
+        return "Error: Result has too many digits to be converted to a string"
+
+
+@mcp.tool(output_schema=None)
+def factorial_log10(
+    n: Annotated[int, "Non-negative integer whose factorial to estimate"],
+) -> str:
+    """Calculate the base-10 logarithm of the factorial of a non-negative integer.
+    
+    Returns log10(n!), the order of magnitude of n!, without computing n! itself. Prefer
+    this over factorial when only the size of a large factorial is needed.
+    """
+    if n < 0:
+        return "Error: Factorial is only defined for non-negative integers"
+    try:
+        log10 = _log10_factorial(n)
+    except OverflowError:
+        return "Error: n is too large to estimate its factorial"
+    return f"Result: log10({n}!) ≈ {log10:.6f}"
 
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 def gcd(
     a: Annotated[int, "First integer"],
     b: Annotated[int, "Second integer"],
@@ -210,11 +659,11 @@ def gcd(
     
     Returns the largest positive integer that divides both a and b.
     """
-    result = math.gcd(a, b)
+    result = _gcd_impl(a, b)
     return f"Result: {result}"
 
 
-@mcp.tool()
+@mcp.tool(output_schema=None)
 def lcm(
     a: Annotated[int, "First integer"],
     b: Annotated[int, "Second integer"],
@@ -223,35 +672,60 @@ def lcm(
     
     Returns the smallest positive integer that is divisible by both a and b.
     """
-    result = math.lcm(a, b)
+    result = _lcm_impl(a, b)
     return f"Result: {result}"
 
 
-@mcp.tool()
-def is_prime(
+@mcp.tool(output_schema=None)
+async def is_prime(
     n: Annotated[int, "Integer to check for primality (must be >= 2)"],
+    show_factor: Annotated[
+        bool, "Search for a factor when n is composite, which can be slow (default: false)"
+    ] = False,
 ) -> str:
     """Check if a number is prime.
     
-    Returns whether n is a prime number (only divisible by 1 and itself).
+    Returns whether n is a prime number (only divisible by 1 and itself). Composites with
+    no small factor only report a divisor if show_factor is set and n < 2^63. Inputs of
+    2^64 and above use the Baillie-PSW test, which has no known counterexamples.
     """
     if n < 2:
         return f"Error: {n} is less than 2. Primality is only defined for integers >= 2"
     
-    # Check for primality using trial division
-    if n == 2:
+    prime, divisor = await asyncio.to_thread(_is_prime_impl, n)
+    if prime:
         return f"{n} is prime"
-    if n % 2 == 0:
-        return f"{n} is not prime"
+    if divisor is None and show_factor and n < _TRIAL_DIVISION_LIMIT:
+        divisor = await asyncio.to_thread(_smallest_factor, n) or None
+    if divisor is not None:
+        return f"{n} is not prime (divisible by {divisor})"
+    return f"{n} is not prime"
+
+
+@mcp.tool(output_schema=None)
+async def factor(
+    n: Annotated[int, "Integer to factorize (must be >= 2)"],
+) -> str:
+    """Factorize an integer into primes.
     
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
-            return f"{n} is not prime (divisible by {i})"
+    Returns the prime factorization of n, e.g. 360 = 2^3 × 3^2 × 5. Returns an error if
+    n has two or more prime factors of more than about 12 digits, as finding them would
+    take too long.
+    """
+    if n < 2:
+        return f"Error: {n} is less than 2. Factorization is only defined for integers >= 2"
     
-    return f"{n} is prime"
+    factors = await asyncio.to_thread(_factorize_impl, n)
+    if factors is None:
+        return f"Error: {n} has prime factors too large to find in reasonable time"
+    return f"Result: {n} = " + " × ".join(f"{p}^{e}" if e > 1 else str(p) for p, e in factors)
+
 
+# Parity names indexed by the lowest bit of an integer
+_PARITY = ("even", "odd")
 
-@mcp.tool()
+
+@mcp.tool(output_schema=None)
 def is_even(
     n: Annotated[int, "Integer to check"],
 ) -> str:
@@ -259,7 +733,131 @@ def is_even(
     
     Returns whether n is divisible by 2.
     """
-    return f"{n} is {'even' if n % 2 == 0 else 'odd'}"
+    return f"{n} is {_PARITY[n & 1]}"
+
+
+# =============================================================================
+# BATCH OPERATIONS
+# =============================================================================
+
+
+# Operations available to batch_eval, keyed by tool name and taking the tool's arguments.
+# Each returns the same response as the tool, sharing its validation where it has any.
+_BATCH_OPS: dict[str, Callable[..., str]] = {
+    "add": lambda a, b: "Result: " + str(a + b),
+    "subtract": lambda a, b: "Result: " + str(a - b),
+    "multiply": lambda a, b: "Result: " + str(a * b),
+    "divide": _divide_result,
+    "power": _power_result,
+    "sqrt": _sqrt_result,
+    "logarithm": _logarithm_result,
+    "absolute": lambda x: "Result: " + str(abs(x)),
+    "modulo": _modulo_result,
+}
+
+
+# Array versions of the batch operations, used for large groups of the same operation.
+# Only operations whose NumPy result is bit-identical to the scalar one are included;
+# power and logarithm can differ in the last digit or in which inputs are errors.
+_BATCH_UFUNCS: dict[str, Callable[..., Any]] = {} if np is None else {
+    "add": lambda a, b: np.add(a, b),
+    "subtract": lambda a, b: np.subtract(a, b),
+    "multiply": lambda a, b: np.multiply(a, b),
+    "divide": lambda a, b: np.divide(a, b),
+    "sqrt": lambda x: np.sqrt(x),
+    "absolute": lambda x: np.abs(x),
+    "modulo": lambda a, b: np.remainder(a, b),
+}
+
+# Groups of the same operation larger than this are evaluated with NumPy
+_BATCH_VECTORIZE_MIN = 64
+
+
+def _batch_eval_one(op: dict[str, Any]) -> str:
+    """Evaluate a single batch_eval entry, reporting any failure as an error string."""
+    name = op.get("op")
+    func = _BATCH_OPS.get(name) if isinstance(name, str) else None
+    if func is None:
+        return f"Error: Unknown operation {name!r}"
+    args = op.get("args", {})
+    if not isinstance(args, dict):
+        return "Error: args must be an object mapping argument names to numbers"
+    try:
+        kwargs = {key: float(value) for key, value in args.items()}
+    except OverflowError:
+        return "Error: Argument is too large"
+    except TypeError:
+        return f"Error: Invalid arguments for {name}: {sorted(args)}"
+    except ValueError as e:
+        return f"Error: {e}"
+    try:
+        return func(**kwargs)
+    except TypeError:
+        return f"Error: Invalid arguments for {name}: {sorted(args)}"
+    except OverflowError:
+        return "Error: Result is too large"
+    except (ValueError, ZeroDivisionError) as e:
+        return f"Error: {e}"
+
+
+def _batch_eval_vectorized(
+    ops: list[dict[str, Any]],
+    name: str,
+    keys: tuple[str, ...],
+    indices: list[int],
+    results: list[str | None],
+) -> None:
+    """Fill in results for ops[i], i in indices, which all call name with the same keys.
+    
+    Entries whose result is not finite are left as None so the scalar path reports the
+    same error or value the single-op evaluation would. Arguments are converted with
+    float() as in the scalar path, and any that cannot be leave the whole group to it.
+    """
+    try:
+        arrays = {
+            key: np.array([float(ops[i]["args"][key]) for i in indices]) for key in keys
+        }
+        with np.errstate(all="ignore"):
+            values = _BATCH_UFUNCS[name](**arrays)
+    except (TypeError, ValueError, OverflowError):
+        return
+    for i, value, finite in zip(indices, values.tolist(), np.isfinite(values).tolist()):
+        if finite:
+            results[i] = "Result: " + str(value)
+
+
+@mcp.tool(output_schema=None)
+def batch_eval(
+    ops: Annotated[
+        list[dict[str, Any]],
+        'Operations to run, e.g. [{"op": "add", "args": {"a": 1, "b": 2}}]',
+    ],
+) -> list[str]:
+    """Evaluate several arithmetic operations in a single call.
+    
+    Returns one result per operation, in order. Supports add, subtract, multiply, divide,
+    power, sqrt, logarithm, absolute and modulo with the same argument names as those
+    tools. Failed operations yield an error string in place. Prefer this tool over
+    individual calls when evaluating more than two operations.
+    """
+    if np is None or len(ops) <= _BATCH_VECTORIZE_MIN:
+        return [_batch_eval_one(op) for op in ops]
+    
+    # Group ops by operation and argument names, and vectorize the large groups
+    groups: dict[tuple[str, tuple[str, ...]], list[int]] = {}
+    for i, op in enumerate(ops):
+        name = op.get("op")
+        args = op.get("args", {})
+        if isinstance(name, str) and name in _BATCH_UFUNCS and isinstance(args, dict):
+            groups.setdefault((name, tuple(args)), []).append(i)
+    results: list[str | None] = [None] * len(ops)
+    for (name, keys), indices in groups.items():
+        if len(indices) > _BATCH_VECTORIZE_MIN:
+            _batch_eval_vectorized(ops, name, keys, indices, results)
+    for i, result in enumerate(results):
+        if result is None:
+            results[i] = _batch_eval_one(ops[i])
+    return results  # type: ignore[return-value]
 
 
 # =============================================================================
@@ -288,7 +886,14 @@ def main(host: str, port: int) -> None:
     basic arithmetic, advanced operations, and number theory tools.
     """
     click.echo(f"Starting MCP Math Server on {host}:{port}")
-    mcp.run(port=port, host=host, transport="streamable-http")
+    if uvloop is None:
+        mcp.run(port=port, host=host, transport="streamable-http")
+        return
+    # mcp.run() starts the default asyncio loop, so run the server on uvloop through anyio
+    anyio.run(
+        partial(mcp.run_async, transport="streamable-http", host=host, port=port),
+        backend_options={"use_uvloop": True},
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+"""
+Tests that batch_eval gives the same answers whether or not it vectorizes a group.
+"""
+
+import random
+
+from mcp_math_server import server
+
+# FastMCP wraps decorated tools; call the underlying function directly
+batch_eval = server.batch_eval.fn
+
+
+def _random_value(rng: random.Random) -> float | int:
+    """A random argument, biased towards values that hit error and edge cases."""
+    choice = rng.random()
+    if choice < 0.15:
+        return rng.choice([0, 0.0, -0.0, 1, 1.0, -1, 2])
+    if choice < 0.4:
+        return rng.randint(-1000, 1000)
+    return rng.uniform(-1000, 1000)
+
+
+def _random_ops(rng: random.Random, count: int) -> list[dict]:
+    """Random batch entries covering every operation batch_eval supports."""
+    ops = []
+    for _ in range(count):
+        name = rng.choice(sorted(server._BATCH_OPS))
+        if name in ("sqrt", "absolute"):
+            args = {"x": _random_value(rng)}
+        elif name == "logarithm":
+            args = {"x": _random_value(rng), "base": _random_value(rng)}
+        elif name == "power":
+            args = {"base": _random_value(rng), "exponent": rng.randint(-8, 8)}
+        else:
+            args = {"a": _random_value(rng), "b": _random_value(rng)}
+        ops.append({"op": name, "args": args})
+    return ops
+
+
+def test_vectorized_results_match_scalar():
+    rng = random.Random(0)
+    for _ in range(5):
+        ops = _random_ops(rng, 2000)
+        assert batch_eval(ops) == [server._batch_eval_one(op) for op in ops]
+
+
+def test_list_arguments_are_rejected_in_large_batches():
+    ops = [{"op": "add", "args": {"a": [1, 2], "b": [3, 4]}}] * (
+        server._BATCH_VECTORIZE_MIN + 1
+    )
+    assert batch_eval(ops) == batch_eval(ops[:1]) * len(ops)
+    assert batch_eval(ops[:1])[0].startswith("Error: Invalid arguments")
+
+
+def test_malformed_op_names_fail_only_their_entry():
+    valid = {"op": "add", "args": {"a": 1, "b": 2}}
+    for malformed in ({"op": ["add"], "args": {"a": 1, "b": 2}}, {"op": {"x": 1}}):
+        small = batch_eval([valid, malformed])
+        large = batch_eval([valid] * (server._BATCH_VECTORIZE_MIN + 1) + [malformed])
+        assert small[0] == large[0] == "Result: 3.0"
+        assert small[-1] == large[-1]
+        assert small[-1].startswith("Error: Unknown operation")
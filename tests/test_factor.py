@@ -0,0 +1,41 @@
+"""
+Regression tests for the prime factorization behind factor.
+"""
+
+import asyncio
+import math
+import random
+
+from mcp_math_server import server
+
+# FastMCP wraps decorated tools; call the underlying function directly
+factor = server.factor.fn
+
+
+def test_factorization_round_trips_on_random_64_bit_inputs():
+    rng = random.Random(0)
+    for _ in range(300):
+        n = rng.randrange(2, 2 ** 64)
+        factors = server._factorize_impl(n)
+        assert factors is not None, n
+        assert math.prod(p ** e for p, e in factors) == n
+        assert [p for p, _ in factors] == sorted({p for p, _ in factors})
+        assert all(server._is_prime_impl(p)[0] for p, _ in factors)
+
+
+def test_products_of_two_large_primes():
+    assert server._factorize_impl((10 ** 12 + 39) * (10 ** 12 + 61)) == (
+        (10 ** 12 + 39, 1),
+        (10 ** 12 + 61, 1),
+    )
+
+
+def test_gives_up_on_factors_too_large_to_find():
+    n = (10 ** 14 + 31) * (10 ** 14 + 67)
+    assert server._factorize_impl(n) is None
+    assert asyncio.run(factor(n)).startswith("Error:")
+
+
+def test_factor_output():
+    assert asyncio.run(factor(360)) == "Result: 360 = 2^3 × 3^2 × 5"
+    assert asyncio.run(factor(1)).startswith("Error:")
@@ -0,0 +1,70 @@
+"""
+Regression tests for the primality test behind is_prime.
+"""
+
+import math
+
+from mcp_math_server import server
+
+
+def _is_prime(n: int) -> bool:
+    return server._is_prime_impl(n)[0]
+
+
+def _sieve(limit: int) -> list[bool]:
+    """Primality of every integer below limit by the sieve of Eratosthenes."""
+    prime = [True] * limit
+    prime[0] = prime[1] = False
+    for p in range(2, math.isqrt(limit - 1) + 1):
+        if prime[p]:
+            prime[p * p::p] = [False] * len(range(p * p, limit, p))
+    return prime
+
+
+def test_matches_trial_division_below_10_5():
+    for n in range(2, 10 ** 5):
+        expected = all(n % p for p in range(2, math.isqrt(n) + 1))
+        assert _is_prime(n) == expected, n
+
+
+def test_base_2_strong_pseudoprimes_are_composite():
+    # Odd composites that pass the base-2 test must be caught by the hashed witness
+    prime = _sieve(10 ** 6)
+    pseudoprimes = [
+        n for n in range(3, 10 ** 6, 2)
+        if not prime[n] and server._miller_rabin(n, (2,))
+    ]
+    assert pseudoprimes[:3] == [2047, 3277, 4033]
+    # Larger ones with no factor in _SMALL_PRIMES, which reach the hashed witness
+    large = [1373653, 25326001, 3215031751]
+    assert all(server._miller_rabin(n, (2,)) for n in large)
+    for n in pseudoprimes + large:
+        assert not _is_prime(n), n
+
+
+def test_products_of_primes_near_2_32():
+    assert not _is_prime(65521 * 65537)
+    assert not _is_prime(65521 * 65521)
+    assert _is_prime(4294967291)
+
+
+def test_strong_lucas_pseudoprimes_below_10_5():
+    prime = _sieve(10 ** 5)
+    pseudoprimes = [
+        n for n in range(3, 10 ** 5, 2)
+        if not prime[n] and server._strong_lucas(n)
+    ]
+    assert pseudoprimes == [
+        5459, 5777, 10877, 16109, 18971, 22499, 24569, 25199, 40309, 58519, 75077, 97439,
+    ]
+    assert all(server._strong_lucas(n) for n in range(3, 10 ** 5, 2) if prime[n])
+
+
+def test_baillie_psw_above_2_64():
+    # Strong pseudoprime to every base in _MR_WITNESSES
+    n = 318665857834031151167461
+    assert server._miller_rabin(n, server._MR_WITNESSES)
+    assert not _is_prime(n)
+    assert _is_prime(2 ** 89 - 1)
+    assert _is_prime(2 ** 127 - 1)
+    assert not _is_prime((2 ** 61 - 1) * (2 ** 89 - 1))